@@ -6,7 +6,16 @@ eda_cli – мини-утилита для EDA CSV-файлов.
 - на Семинаре 04 как библиотека для обёрток (HTTP-сервис и т.п.).
 """
 
-from . import core, viz
+import importlib
+
+from . import core
 
 __all__ = ["core", "viz"]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    # viz тянет matplotlib, поэтому подгружаем его только по обращению
+    if name == "viz":
+        return importlib.import_module(f"{__name__}.viz")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
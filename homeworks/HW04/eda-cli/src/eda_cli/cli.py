@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import datetime
+import hashlib
+import importlib.util
+import os
+import pickle
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, TypeVar
 
 import pandas as pd
+import pandas.api.types as ptypes
 import typer
 
+from . import __version__
 from .core import (
     DatasetSummary,
+    classify_columns,
     compute_quality_flags,
     correlation_matrix,
     flatten_summary_for_print,
@@ -15,16 +23,117 @@ from .core import (
     summarize_dataset,
     top_categories,
 )
-from .viz import (
-    plot_correlation_heatmap,
-    plot_missing_matrix,
-    plot_histograms_per_column,
-    save_top_categories_tables,
-    plot_categorical_bar_chart,  # ← импортирована новая функция
-)
 
 app = typer.Typer(help="Мини-CLI для EDA CSV-файлов")
 
+# Многопоточный парсер pyarrow окупается только на крупных файлах:
+# у него заметные накладные расходы на старт.
+PYARROW_MIN_BYTES = 1 << 20
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Версия формата дискового кэша. Увеличивать при любом изменении того, что
+# кладётся в кэш (поля DatasetSummary, формат таблиц, логика расчётов).
+_CACHE_VERSION = 2
+# Сколько файлов кэша держать всего; более старые удаляются
+_CACHE_MAX_FILES = 200
+
+T = TypeVar("T")
+
+
+def _cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "eda-cli"
+
+
+def _hash(raw: str) -> str:
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _cache_key(path: Path, sep: str, encoding: str) -> str:
+    """
+    Ключ кэша вида "<источник>-<состояние>":
+    - источник: путь к файлу + параметры чтения;
+    - состояние: mtime/размер файла, версия кэша и пакета, наличие numba/pyarrow
+      (от них зависят способ чтения и расчёт статистик).
+    Изменение файла меняет состояние, и старые записи просто не находятся.
+    """
+    stat = path.stat()
+    source = _hash(f"{path.resolve()}:{sep}:{encoding}")
+    state = _hash(
+        f"{stat.st_mtime_ns}:{stat.st_size}:{_CACHE_VERSION}:{__version__}:"
+        f"numba={_HAS_NUMBA}:pyarrow={_HAS_PYARROW}"
+    )
+    return f"{source}-{state}"
+
+
+def _prune_cache(cache_dir: Path, key: str) -> None:
+    """
+    Удаляет записи того же источника с другим состоянием (устаревшие версии
+    файла) и самые старые файлы сверх _CACHE_MAX_FILES.
+    """
+    source = key.split("-", 1)[0]
+    for stale in cache_dir.glob(f"{source}-*.pkl"):
+        if not stale.name.startswith(f"{key}_"):
+            stale.unlink(missing_ok=True)
+
+    files = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for old in files[_CACHE_MAX_FILES:]:
+        old.unlink(missing_ok=True)
+
+
+def _cached(
+    key: Optional[str],
+    name: str,
+    compute: Callable[[], T],
+    expected_type: type,
+) -> T:
+    """
+    Достаёт результат из дискового кэша (pickle) или считает и сохраняет его.
+    При key=None кэш не используется. Битый файл или объект не того типа
+    считаются промахом; ошибки кэша не мешают расчёту.
+    """
+    if key is None:
+        return compute()
+
+    cache_dir = _cache_dir()
+    cache_path = cache_dir / f"{key}_{name}.pkl"
+    try:
+        with cache_path.open("rb") as f:
+            cached = pickle.load(f)
+        if isinstance(cached, expected_type):
+            return cached
+    except Exception:  # noqa: BLE001
+        pass
+
+    result = compute()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _prune_cache(cache_dir, key)
+    except OSError:
+        pass
+    return result
+
+
+def _arrow_temporal_positions(df: pd.DataFrame) -> List[int]:
+    """
+    Позиции колонок, которые pyarrow сам распознал как дату/время.
+    C-парсер оставляет такие значения строками.
+    """
+    positions = []
+    for pos, (_, s) in enumerate(df.items()):
+        if ptypes.is_datetime64_any_dtype(s.dtype):
+            positions.append(pos)
+        elif ptypes.is_object_dtype(s.dtype):
+            # pyarrow типизирует колонку целиком, хватает первого значения
+            first = s.first_valid_index()
+            if first is not None and isinstance(s.loc[first], (datetime.date, datetime.time)):
+                positions.append(pos)
+    return positions
+
 
 def _load_csv(
     path: Path,
@@ -33,7 +142,24 @@ def _load_csv(
 ) -> pd.DataFrame:
     if not path.exists():
         raise typer.BadParameter(f"Файл '{path}' не найден")
+    # pyarrow понимает только односимвольный разделитель; для остальных
+    # (\s+, регулярки) pandas сам выберет подходящий парсер
+    use_pyarrow = _HAS_PYARROW and len(sep) == 1 and path.stat().st_size > PYARROW_MIN_BYTES
     try:
+        if use_pyarrow:
+            try:
+                df = pd.read_csv(path, sep=sep, encoding=encoding, engine="pyarrow")
+            except ValueError:
+                pass  # то, что pyarrow не осилил, читаем обычным парсером
+            else:
+                # Типы не должны зависеть от размера файла: даты и время,
+                # которые pyarrow разобрал сам, перечитываем строками
+                positions = _arrow_temporal_positions(df)
+                if positions:
+                    raw = pd.read_csv(path, sep=sep, encoding=encoding, usecols=positions)
+                    for i, pos in enumerate(positions):
+                        df.isetitem(pos, raw.iloc[:, i])
+                return df
         return pd.read_csv(path, sep=sep, encoding=encoding)
     except Exception as exc:  # noqa: BLE001
         raise typer.BadParameter(f"Не удалось прочитать CSV: {exc}") from exc
@@ -73,21 +199,48 @@ def report(
     min_missing_share: float = typer.Option(0.1, help="Порог доли пропусков для выделения проблемных колонок (0.0–1.0)."),
     categorical_bar_column: str = typer.Option("country", "--categorical-bar-column", help="Колонка для bar chart."),
     categorical_bar_top_n: int = typer.Option(10, "--categorical-bar-top-n", help="Число top-категорий для bar chart."),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Кэшировать расчёты на диске (~/.cache/eda-cli)."),
 ) -> None:
     """
     Сгенерировать полный EDA-отчёт с расширенными настройками.
     """
+    # matplotlib тяжёлый: импортируем графику только там, где она нужна
+    from .viz import (
+        plot_correlation_heatmap,
+        plot_missing_matrix,
+        plot_histograms_per_column,
+        save_top_categories_tables,
+        plot_categorical_bar_chart,
+    )
+
     out_root = Path(out_dir)
     out_root.mkdir(parents=True, exist_ok=True)
 
-    df = _load_csv(Path(path), sep=sep, encoding=encoding)
+    # Ключ кэша снимаем до чтения; если файл изменился, пока его читали,
+    # ключи до и после не совпадут, и результаты в кэш не попадут
+    src = Path(path)
+    cache_key = _cache_key(src, sep, encoding) if use_cache and src.exists() else None
+    df = _load_csv(src, sep=sep, encoding=encoding)
+    if cache_key is not None and _cache_key(src, sep, encoding) != cache_key:
+        cache_key = None
 
-    # 1. Обзор
-    summary = summarize_dataset(df)
+    # 1. Обзор (повторные запуски на том же файле берут результаты из кэша)
+    numeric_cols, cat_cols = classify_columns(df)
+    summary = _cached(cache_key, "summary", lambda: summarize_dataset(df), DatasetSummary)
     summary_df = flatten_summary_for_print(summary)
-    missing_df = missing_table(df)
-    corr_df = correlation_matrix(df)
-    top_cats = top_categories(df, top_k=top_k_categories)
+    missing_df = _cached(cache_key, "missing", lambda: missing_table(df), pd.DataFrame)
+    corr_df = _cached(
+        cache_key,
+        "corr",
+        lambda: correlation_matrix(df, numeric_cols=numeric_cols),
+        pd.DataFrame,
+    )
+    top_cats = _cached(
+        cache_key,
+        f"top_categories_{top_k_categories}",
+        lambda: top_categories(df, top_k=top_k_categories, cat_cols=cat_cols),
+        dict,
+    )
 
     # 2. Качество в целом
     quality_flags = compute_quality_flags(summary, missing_df)
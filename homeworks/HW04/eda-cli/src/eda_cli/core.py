@@ -1,13 +1,59 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Sequence
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 from pandas.api import types as ptypes
 
+try:
+    from numba import njit
+except ImportError:  # numba — необязательная зависимость (extra "fast")
+    njit = None
 
-@dataclass
+
+def _agg4(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    min/max/mean/std (ddof=1) за один проход по массиву без NaN (алгоритм Уэлфорда).
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    mn = np.inf
+    mx = -np.inf
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        if x < mn:
+            mn = x
+        if x > mx:
+            mx = x
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return mn, mx, mean, std
+
+
+_agg4_jit = njit(cache=True, nogil=True)(_agg4) if njit is not None else None
+
+
+def _stats_dtype(dtype: Any) -> type:
+    """
+    В каком типе читать колонку для статистик. float32 вдвое сокращает объём
+    читаемой памяти; берём его только там, где он точно представляет значения
+    (float32/float16 и целые/bool до 16 бит). Накопление всё равно в float64.
+    """
+    kind = getattr(dtype, "kind", None)
+    itemsize = getattr(dtype, "itemsize", 8)
+    if (kind == "f" and itemsize <= 4) or (kind in ("i", "u", "b") and itemsize <= 2):
+        return np.float32
+    return np.float64
+
+
+@dataclass(slots=True)
 class ColumnSummary:
     name: str
     dtype: str
@@ -23,23 +69,115 @@ class ColumnSummary:
     std: Optional[float] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Явный словарь вместо asdict: тот вызывает deepcopy для каждого поля
+        return {
+            "name": self.name,
+            "dtype": self.dtype,
+            "non_null": self.non_null,
+            "missing": self.missing,
+            "missing_share": self.missing_share,
+            "unique": self.unique,
+            "example_values": list(self.example_values),
+            "is_numeric": self.is_numeric,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "std": self.std,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetSummary:
     n_rows: int
     n_cols: int
     columns: List[ColumnSummary]
+    # Число константных и высококардинальных категориальных колонок.
+    # Считаются в summarize_dataset, чтобы флаги качества не проходили колонки
+    # заново; значений по умолчанию нет, чтобы их нельзя было забыть.
+    n_constant: int
+    n_high_card: int
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "n_rows": self.n_rows,
             "n_cols": self.n_cols,
+            "n_constant": self.n_constant,
+            "n_high_card": self.n_high_card,
             "columns": [c.to_dict() for c in self.columns],
         }
 
 
+# Категориальная колонка с большим числом уникальных значений — «высокая кардинальность»
+HIGH_CARDINALITY_THRESHOLD = 50
+
+# Начиная с этого числа колонок обзор считается в пуле потоков.
+# Без GIL идут только numpy-редукции и ядро numba (nogil); notna/unique
+# по object-колонкам GIL держат, поэтому на одном ядре пул — чистые накладные
+# расходы и не используется.
+PARALLEL_MIN_COLUMNS = 8
+_MAX_WORKERS = os.cpu_count() or 1
+
+
+def _summarize_column(
+    name: Any,
+    s: pd.Series,
+    n_rows: int,
+    example_values_per_column: int,
+    stats: Optional[Tuple[Any, Any, Any, Any]] = None,
+) -> ColumnSummary:
+    """
+    Обзор одной колонки (см. summarize_dataset).
+    stats — заранее посчитанные (min, max, mean, std); если их нет,
+    статистики считаются здесь JIT-ядром (см. summarize_dataset).
+    """
+    # Маску непустых значений считаем один раз и переиспользуем
+    mask = s.notna().to_numpy()
+    non_null = int(mask.sum())
+    missing = n_rows - non_null
+    missing_share = float(missing / n_rows) if n_rows > 0 else 0.0
+
+    # Уникальные значения дают и количество, и примеры;
+    # примеры выводим как строки (обрезаем до k перед приведением)
+    uniq_values = s[mask].unique()
+    unique = len(uniq_values)
+    head = uniq_values[:example_values_per_column]
+    if ptypes.is_object_dtype(s.dtype) or isinstance(s.dtype, pd.StringDtype):
+        # Строки уже строки — приводим только то, что ими не является
+        examples = [v if isinstance(v, str) else str(v) for v in head]
+    else:
+        examples = head.astype(str).tolist()
+
+    is_numeric = bool(ptypes.is_numeric_dtype(s))
+    min_val: Optional[float] = None
+    max_val: Optional[float] = None
+    mean_val: Optional[float] = None
+    std_val: Optional[float] = None
+
+    if is_numeric and non_null > 0:
+        if stats is None:
+            values = s.to_numpy(dtype=_stats_dtype(s.dtype), na_value=np.nan)[mask]
+            stats = _agg4_jit(values)
+        # в смешанных (nullable) блоках пропуск приходит как pd.NA
+        min_val, max_val, mean_val, std_val = (
+            float("nan") if pd.isna(v) else float(v) for v in stats
+        )
+
+    return ColumnSummary(
+        name=name,
+        dtype=str(s.dtype),
+        non_null=non_null,
+        missing=missing,
+        missing_share=missing_share,
+        unique=unique,
+        example_values=examples,
+        is_numeric=is_numeric,
+        min=min_val,
+        max=max_val,
+        mean=mean_val,
+        std=std_val,
+    )
+
+
 def summarize_dataset(
     df: pd.DataFrame,
     example_values_per_column: int = 3,
@@ -52,56 +190,62 @@ def summarize_dataset(
     - количество уникальных;
     - несколько примерных значений;
     - базовые числовые статистики (для numeric).
+    Колонки независимы, поэтому на широких таблицах (и нескольких ядрах)
+    считаются параллельно.
     """
     n_rows, n_cols = df.shape
-    columns: List[ColumnSummary] = []
 
-    for name in df.columns:
-        s = df[name]
-        dtype_str = str(s.dtype)
-
-        non_null = int(s.notna().sum())
-        missing = n_rows - non_null
-        missing_share = float(missing / n_rows) if n_rows > 0 else 0.0
-        unique = int(s.nunique(dropna=True))
-
-        # Примерные значения выводим как строки
-        examples = (
-            s.dropna().astype(str).unique()[:example_values_per_column].tolist()
-            if non_null > 0
-            else []
+    # Числовые статистики считаются одним из двух способов:
+    # - с numba — однопроходным JIT-ядром внутри _summarize_column;
+    # - без numba — здесь, четырьмя редукциями сразу по блокам всех
+    #   числовых колонок, а не отдельными вызовами на колонку.
+    block_stats: Dict[int, Tuple[Any, Any, Any, Any]] = {}
+    numeric_pos = [i for i, dtype in enumerate(df.dtypes) if ptypes.is_numeric_dtype(dtype)]
+    if _agg4_jit is None and numeric_pos:
+        numeric_df = df.iloc[:, numeric_pos]
+        block_stats = dict(
+            zip(
+                numeric_pos,
+                zip(
+                    numeric_df.min().tolist(),
+                    numeric_df.max().tolist(),
+                    numeric_df.mean().tolist(),
+                    numeric_df.std().tolist(),
+                ),
+            )
         )
 
-        is_numeric = bool(ptypes.is_numeric_dtype(s))
-        min_val: Optional[float] = None
-        max_val: Optional[float] = None
-        mean_val: Optional[float] = None
-        std_val: Optional[float] = None
-
-        if is_numeric and non_null > 0:
-            min_val = float(s.min())
-            max_val = float(s.max())
-            mean_val = float(s.mean())
-            std_val = float(s.std())
-
-        columns.append(
-            ColumnSummary(
-                name=name,
-                dtype=dtype_str,
-                non_null=non_null,
-                missing=missing,
-                missing_share=missing_share,
-                unique=unique,
-                example_values=examples,
-                is_numeric=is_numeric,
-                min=min_val,
-                max=max_val,
-                mean=mean_val,
-                std=std_val,
-            )
+    def summarize(i: int) -> ColumnSummary:
+        return _summarize_column(
+            df.columns[i],
+            df.iloc[:, i],
+            n_rows,
+            example_values_per_column,
+            stats=block_stats.get(i),
         )
 
-    return DatasetSummary(n_rows=n_rows, n_cols=n_cols, columns=columns)
+    if n_cols > PARALLEL_MIN_COLUMNS and _MAX_WORKERS > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, n_cols)) as pool:
+            # map сохраняет порядок колонок
+            columns = list(pool.map(summarize, range(n_cols)))
+    else:
+        columns = [summarize(i) for i in range(n_cols)]
+
+    n_constant = 0
+    n_high_card = 0
+    for col in columns:
+        if col.unique == 1:
+            n_constant += 1
+        if not col.is_numeric and col.unique > HIGH_CARDINALITY_THRESHOLD:
+            n_high_card += 1
+
+    return DatasetSummary(
+        n_rows=n_rows,
+        n_cols=n_cols,
+        columns=columns,
+        n_constant=n_constant,
+        n_high_card=n_high_card,
+    )
 
 
 def missing_table(df: pd.DataFrame) -> pd.DataFrame:
@@ -111,7 +255,8 @@ def missing_table(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=["missing_count", "missing_share"])
 
-    total = df.isna().sum()
+    # count() не материализует булеву маску размером со всю таблицу
+    total = len(df) - df.count()
     share = total / len(df)
     result = (
         pd.DataFrame(
@@ -125,44 +270,149 @@ def missing_table(df: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
-def correlation_matrix(df: pd.DataFrame) -> pd.DataFrame:
+def _pairwise_corr(values: np.ndarray) -> np.ndarray:
+    """
+    Попарная корреляция Пирсона с исключением NaN (как в DataFrame.corr).
+    Суммы по общим для каждой пары строкам считаются матричными
+    произведениями с маской (BLAS) вместо цикла по парам колонок.
+    """
+    valid = ~np.isnan(values)
+    m = valid.astype(np.float64)
+    # Сдвиг на среднее колонки не меняет корреляцию, но убирает потерю
+    # точности при вычитании больших сумм
+    x = np.where(valid, values, 0.0)
+    counts = m.sum(axis=0)
+    x -= np.divide(x.sum(axis=0), counts, out=np.zeros_like(counts), where=counts > 0)
+    x *= m
+
+    n = m.T @ m              # число общих строк для пары (i, j)
+    sx = x.T @ m             # сумма x_i по строкам, где есть и x_j
+    sxx = (x * x).T @ m      # сумма x_i**2 по тем же строкам
+    sxy = x.T @ x            # сумма x_i * x_j
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sx.T / n
+        var_x = sxx - sx * sx / n
+        corr = cov / np.sqrt(var_x * var_x.T)
+
+    # Если общие строки пары далеки от среднего всей колонки, разность сумм
+    # теряет значащие цифры; такие пары пересчитываем в два прохода
+    # по их общим строкам
+    inexact = (var_x <= 1e-4 * sxx) & (n >= 2)
+    inexact |= inexact.T
+    for i, j in zip(*np.nonzero(np.triu(inexact))):
+        both = valid[:, i] & valid[:, j]
+        dx = values[both, i] - values[both, i].mean()
+        dy = values[both, j] - values[both, j].mean()
+        denom = np.sqrt((dx @ dx) * (dy @ dy))
+        corr[i, j] = corr[j, i] = (dx @ dy) / denom if denom > 0 else np.nan
+
+    corr[n < 2] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    diag = np.diag_indices_from(corr)
+    corr[diag] = np.where(np.isnan(corr[diag]), np.nan, 1.0)
+    return corr
+
+
+def _numeric_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # timedelta входит в "number", но корреляцию для неё не считаем
+    return df.select_dtypes(include="number", exclude="timedelta")
+
+
+def _categorical_columns(df: pd.DataFrame) -> List[Any]:
+    return [
+        name
+        for name, dtype in df.dtypes.items()
+        if ptypes.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype)
+    ]
+
+
+def classify_columns(df: pd.DataFrame) -> Tuple[List[Any], List[Any]]:
+    """
+    Разбивает колонки по типам один раз для всех расчётов:
+    (числовые без timedelta, категориальные/строковые).
+    """
+    numeric_cols = _numeric_frame(df).columns.tolist()
+    return numeric_cols, _categorical_columns(df)
+
+
+def correlation_matrix(
+    df: pd.DataFrame,
+    numeric_cols: Optional[Sequence[Any]] = None,
+) -> pd.DataFrame:
     """
     Корреляция Пирсона для числовых колонок.
+    numeric_cols — готовый список числовых колонок (см. classify_columns).
+
+    Без пропусков считаем через np.corrcoef (BLAS), с пропусками
+    (или меньше двух строк) — попарно, исключая NaN для каждой пары колонок.
     """
-    numeric_df = df.select_dtypes(include="number")
+    if numeric_cols is None:
+        numeric_df = _numeric_frame(df)
+    else:
+        numeric_df = df[list(numeric_cols)]
     if numeric_df.empty:
         return pd.DataFrame()
-    return numeric_df.corr(numeric_only=True)
+
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    if len(values) < 2 or np.isnan(values).any():
+        corr = _pairwise_corr(values)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.atleast_2d(np.corrcoef(values, rowvar=False))
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
 
 
 def top_categories(
     df: pd.DataFrame,
     max_columns: int = 5,
     top_k: int = 5,
+    cat_cols: Optional[Sequence[Any]] = None,
 ) -> Dict[str, pd.DataFrame]:
     """
     Для категориальных/строковых колонок считает top-k значений.
+    cat_cols — готовый список таких колонок (см. classify_columns).
     Возвращает словарь: колонка -> DataFrame со столбцами value/count/share.
     """
     result: Dict[str, pd.DataFrame] = {}
-    candidate_cols: List[str] = []
-
-    for name in df.columns:
-        s = df[name]
-        if ptypes.is_object_dtype(s) or isinstance(s.dtype, pd.CategoricalDtype):
-            candidate_cols.append(name)
+    candidate_cols = list(cat_cols) if cat_cols is not None else _categorical_columns(df)
 
     for name in candidate_cols[:max_columns]:
         s = df[name]
-        vc = s.value_counts(dropna=True).head(top_k)
-        if vc.empty:
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            codes = s.cat.codes.to_numpy()
+            labels = s.cat.categories
+        else:
+            # Строки хешируются один раз, дальше работаем с целочисленными
+            # кодами; без сортировки коды идут в порядке первого появления
+            codes, labels = pd.factorize(s, sort=False)
+            labels = pd.Index(labels)
+
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+        k = min(top_k, len(counts))
+        if k <= 0:
             continue
-        share = vc / vc.sum()
+
+        # Частичная сортировка: O(U) на выбор top-k вместо полной O(U log U).
+        # При равных частотах побеждает меньший код — как в value_counts
+        # (первое появление для строк, порядок категорий для category).
+        if k < len(counts):
+            kth = np.partition(counts, len(counts) - k)[len(counts) - k]
+            above = np.flatnonzero(counts > kth)
+            ties = np.flatnonzero(counts == kth)[: k - above.size]
+            idx = np.sort(np.concatenate([above, ties]))
+        else:
+            idx = np.arange(k)
+        idx = idx[np.argsort(-counts[idx], kind="stable")]
+        top_counts = counts[idx]
+
+        with np.errstate(invalid="ignore"):
+            share = top_counts / top_counts.sum()
         table = pd.DataFrame(
             {
-                "value": vc.index.astype(str),
-                "count": vc.values,
-                "share": share.values,
+                "value": labels[idx].astype(str),
+                "count": top_counts,
+                "share": share,
             }
         )
         result[name] = table
@@ -192,47 +442,44 @@ def compute_quality_flags(summary: DatasetSummary, missing_df: pd.DataFrame) ->
     flags["too_many_missing"] = max_missing_share > 0.5
 
     # === 1.колонки, где все значения одинаковые (unique == 1) ===
-    flags["has_constant_columns"] = any(col.unique == 1 for col in summary.columns)
+    flags["has_constant_columns"] = summary.n_constant > 0
 
     # === 2.категориальные колонки с >50 уникальных значений ===
-    high_card_threshold = 50
-    has_high_card = any(
-        (not col.is_numeric) and (col.unique > high_card_threshold)
-        for col in summary.columns
-    )
-    flags["has_high_cardinality_categoricals"] = has_high_card
-
-    # === 3.дубликаты в ID-колонке ===
+    flags["has_high_cardinality_categoricals"] = summary.n_high_card > 0
+
+    # Оставшиеся проверки по колонкам делаем за один проход и выходим,
+    # как только найдено всё, что нужно:
+    # 3. ID-колонка (первая по списку имён) для проверки дубликатов;
+    # 4. has_many_zero_values: для числовых колонок — доля нулей > 50%.
+    #    Так как у нас нет точного количества нулей, используем признаки:
+    #    — min == 0
+    #    — mean близко к 0 (например, mean <= 0.1 * max)
+    #    — non_null > 0
     id_col_names = {"user_id", "id", "customer_id", "ID"}
-    id_col = None
-    for col in summary.columns:
-        if col.name.lower() in id_col_names:
-            id_col = col
-            break
-    if id_col is not None:
-        # Если количество уникальных значений < общего числа строк → есть дубликаты
-        flags["has_suspicious_id_duplicates"] = id_col.unique < summary.n_rows
-    else:
-        flags["has_suspicious_id_duplicates"] = False
-
-    # === 4. has_many_zero_values: для числовых колонок — доля нулей > 50% ===
-    # Так как у нас нет точного количества нулей, используем признаки:
-    # — min == 0
-    # — mean близко к 0 (например, mean <= 0.1 * max)
-    # — non_null > 0
     zero_threshold = 0.5
+
     has_many_zeros = False
+    id_col = None
     for col in summary.columns:
-        if col.is_numeric and col.non_null > 0 and col.min == 0.0:
+        if id_col is None and col.name.lower() in id_col_names:
+            id_col = col
+        if not has_many_zeros and col.is_numeric and col.non_null > 0 and col.min == 0.0:
             # Простая эвристика: если mean очень мал по сравнению с max
             if col.max is not None and col.max > 0:
                 if col.mean is not None and col.mean <= 0.1 * col.max:
                     has_many_zeros = True
-                    break
             # Или если все значения — нули (std == 0 и mean == 0)
             elif col.std == 0.0 and col.mean == 0.0:
                 has_many_zeros = True
-                break
+        if has_many_zeros and id_col is not None:
+            break
+
+    if id_col is not None:
+        # Если количество уникальных значений < общего числа строк → есть дубликаты
+        flags["has_suspicious_id_duplicates"] = id_col.unique < summary.n_rows
+    else:
+        flags["has_suspicious_id_duplicates"] = False
+
     flags["has_many_zero_values"] = has_many_zeros
 
     # === Расчёт скорректированного quality_score ===
@@ -255,25 +502,42 @@ def compute_quality_flags(summary: DatasetSummary, missing_df: pd.DataFrame) ->
 
     return flags
 
+SUMMARY_PRINT_COLUMNS = (
+    "name",
+    "dtype",
+    "non_null",
+    "missing",
+    "missing_share",
+    "unique",
+    "is_numeric",
+    "min",
+    "max",
+    "mean",
+    "std",
+)
+
+
 def flatten_summary_for_print(summary: DatasetSummary) -> pd.DataFrame:
     """
     Превращает DatasetSummary в табличку для более удобного вывода.
     """
-    rows: List[Dict[str, Any]] = []
-    for col in summary.columns:
-        rows.append(
-            {
-                "name": col.name,
-                "dtype": col.dtype,
-                "non_null": col.non_null,
-                "missing": col.missing,
-                "missing_share": col.missing_share,
-                "unique": col.unique,
-                "is_numeric": col.is_numeric,
-                "min": col.min,
-                "max": col.max,
-                "mean": col.mean,
-                "std": col.std,
-            }
-        )
-    return pd.DataFrame(rows)
+    # Кортежи из генератора вместо словаря на каждую строку
+    return pd.DataFrame.from_records(
+        (
+            (
+                col.name,
+                col.dtype,
+                col.non_null,
+                col.missing,
+                col.missing_share,
+                col.unique,
+                col.is_numeric,
+                col.min,
+                col.max,
+                col.mean,
+                col.std,
+            )
+            for col in summary.columns
+        ),
+        columns=SUMMARY_PRINT_COLUMNS,
+    )
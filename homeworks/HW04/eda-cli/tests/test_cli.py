@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import os
+import pickle
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from eda_cli import cli
+
+
+def _write(path, text: str):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _spy_engines(monkeypatch) -> list:
+    """Подменяет pd.read_csv в cli и запоминает, какой engine просили."""
+    engines = []
+    read_csv = pd.read_csv
+
+    def spy(*args, **kwargs):
+        engines.append(kwargs.get("engine"))
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(cli.pd, "read_csv", spy)
+    return engines
+
+
+def test_load_csv_uses_pyarrow_for_large_files(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(cli, "_HAS_PYARROW", True)
+    monkeypatch.setattr(cli, "PYARROW_MIN_BYTES", 0)
+    engines = _spy_engines(monkeypatch)
+    path = _write(
+        tmp_path / "data.csv",
+        "a,b,city,day,ts,at\n"
+        "1,2.5,A,2024-01-01,2024-01-01 10:00:05,10:00:05\n"
+        "3,,B,,2024-01-02T11:30:00,11:30:00\n",
+    )
+
+    df = cli._load_csv(path)
+
+    assert engines[0] == "pyarrow"
+    # даты и время остаются строками, как у C-парсера
+    pd.testing.assert_frame_equal(df, pd.read_csv(path))
+    assert df["ts"].tolist() == ["2024-01-01 10:00:05", "2024-01-02T11:30:00"]
+
+
+def test_load_csv_regex_separator_skips_pyarrow(tmp_path, monkeypatch):
+    """Разделитель вида \\s+ читается независимо от размера файла."""
+    monkeypatch.setattr(cli, "PYARROW_MIN_BYTES", 0)
+    engines = _spy_engines(monkeypatch)
+    path = _write(tmp_path / "data.txt", "a   b\n1  2\n3 4\n")
+
+    df = cli._load_csv(path, sep=r"\s+")
+
+    assert "pyarrow" not in engines
+    assert df.to_dict("list") == {"a": [1, 3], "b": [2, 4]}
+
+
+def test_load_csv_falls_back_when_pyarrow_rejects_options(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "_HAS_PYARROW", True)
+    monkeypatch.setattr(cli, "PYARROW_MIN_BYTES", 0)
+    read_csv = pd.read_csv
+
+    def fake_read_csv(*args, **kwargs):
+        if kwargs.get("engine") == "pyarrow":
+            raise ValueError("unsupported by pyarrow")
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(cli.pd, "read_csv", fake_read_csv)
+    path = _write(tmp_path / "data.csv", "a;b\n1;2\n")
+
+    df = cli._load_csv(path, sep=";")
+
+    assert df.to_dict("list") == {"a": [1], "b": [2]}
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    return tmp_path / "xdg" / "eda-cli"
+
+
+def _counting(value):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return value
+
+    return compute, calls
+
+
+def test_cached_hit_reuses_stored_result(tmp_path, cache_home):
+    path = _write(tmp_path / "data.csv", "a\n1\n")
+    key = cli._cache_key(path, ",", "utf-8")
+    compute, calls = _counting({"x": 1})
+
+    assert cli._cached(key, "top", compute, dict) == {"x": 1}
+    assert cli._cached(key, "top", compute, dict) == {"x": 1}
+    assert len(calls) == 1
+    assert len(list(cache_home.glob("*.pkl"))) == 1
+
+
+def test_cached_miss_after_file_change_prunes_old_entries(tmp_path, cache_home):
+    path = _write(tmp_path / "data.csv", "a\n1\n")
+    old_key = cli._cache_key(path, ",", "utf-8")
+    compute, calls = _counting({"x": 1})
+    cli._cached(old_key, "top", compute, dict)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    new_key = cli._cache_key(path, ",", "utf-8")
+    cli._cached(new_key, "top", compute, dict)
+
+    assert new_key != old_key
+    assert len(calls) == 2
+    assert [p.name for p in cache_home.glob("*.pkl")] == [f"{new_key}_top.pkl"]
+
+
+def test_cached_corrupt_or_wrong_type_is_a_miss(tmp_path, cache_home):
+    path = _write(tmp_path / "data.csv", "a\n1\n")
+    key = cli._cache_key(path, ",", "utf-8")
+    cache_home.mkdir(parents=True)
+    entry = cache_home / f"{key}_top.pkl"
+    compute, calls = _counting({"x": 1})
+
+    entry.write_bytes(b"not a pickle")
+    assert cli._cached(key, "top", compute, dict) == {"x": 1}
+
+    entry.write_bytes(pickle.dumps(["wrong", "type"]))
+    assert cli._cached(key, "top", compute, dict) == {"x": 1}
+    assert len(calls) == 2
+
+
+def test_cache_dir_is_capped(tmp_path, cache_home, monkeypatch):
+    monkeypatch.setattr(cli, "_CACHE_MAX_FILES", 3)
+    for i in range(5):
+        path = _write(tmp_path / f"data_{i}.csv", "a\n1\n")
+        cli._cached(cli._cache_key(path, ",", "utf-8"), "top", lambda: {}, dict)
+
+    assert len(list(cache_home.glob("*.pkl"))) == 3
+
+
+def test_report_cache_and_no_cache(tmp_path, cache_home):
+    path = _write(tmp_path / "data.csv", "a,b,city\n1,2,A\n2,4,B\n3,5,A\n")
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli.app, ["report", str(path), "--out-dir", str(tmp_path / "out1"), "--no-cache"]
+    )
+    assert result.exit_code == 0, result.output
+    assert not cache_home.exists()
+
+    for out in ("out2", "out3"):
+        result = runner.invoke(cli.app, ["report", str(path), "--out-dir", str(tmp_path / out)])
+        assert result.exit_code == 0, result.output
+    assert len(list(cache_home.glob("*.pkl"))) == 4
+    assert (tmp_path / "out1" / "summary.csv").read_text() == (
+        tmp_path / "out3" / "summary.csv"
+    ).read_text()
+
+
+def test_report_skips_cache_when_file_changes_during_read(tmp_path, cache_home, monkeypatch):
+    path = _write(tmp_path / "data.csv", "a,b,city\n1,2,A\n2,4,B\n")
+    load_csv = cli._load_csv
+
+    def load_then_rewrite(*args, **kwargs):
+        df = load_csv(*args, **kwargs)
+        _write(path, "a,b,city\n7,8,C\n9,9,C\n5,5,D\n")
+        return df
+
+    monkeypatch.setattr(cli, "_load_csv", load_then_rewrite)
+    result = CliRunner().invoke(cli.app, ["report", str(path), "--out-dir", str(tmp_path / "out")])
+
+    assert result.exit_code == 0, result.output
+    assert not cache_home.exists()
+
+
+def test_import_cli_does_not_load_matplotlib():
+    """matplotlib подгружается только при обращении к eda_cli.viz."""
+    code = (
+        "import sys, eda_cli.cli, eda_cli\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "viz = eda_cli.viz\n"
+        "assert viz is sys.modules['eda_cli.viz'] and 'matplotlib' in sys.modules\n"
+        "from eda_cli import viz as again\n"
+        "assert again is viz\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import math
+
+import numpy as np
 import pandas as pd
+import pytest
 
+from eda_cli import core
 from eda_cli.core import (
+    DatasetSummary,
+    classify_columns,
     compute_quality_flags,
     correlation_matrix,
     flatten_summary_for_print,
@@ -22,9 +29,15 @@ def _sample_df() -> pd.DataFrame:
     )
 
 
-def test_summarize_dataset_basic():
+@pytest.fixture(scope="module")
+def sample():
+    """Общий для модуля пример: (df, summary, missing_df) считается один раз."""
     df = _sample_df()
-    summary = summarize_dataset(df)
+    return df, summarize_dataset(df), missing_table(df)
+
+
+def test_summarize_dataset_basic(sample):
+    _, summary, _ = sample
 
     assert summary.n_rows == 4
     assert summary.n_cols == 3
@@ -36,20 +49,18 @@ def test_summarize_dataset_basic():
     assert "missing_share" in summary_df.columns
 
 
-def test_missing_table_and_quality_flags():
-    df = _sample_df()
-    missing_df = missing_table(df)
+def test_missing_table_and_quality_flags(sample):
+    _, summary, missing_df = sample
 
     assert "missing_count" in missing_df.columns
     assert missing_df.loc["age", "missing_count"] == 1
 
-    summary = summarize_dataset(df)
     flags = compute_quality_flags(summary, missing_df)
     assert 0.0 <= flags["quality_score"] <= 1.0
 
 
-def test_correlation_and_top_categories():
-    df = _sample_df()
+def test_correlation_and_top_categories(sample):
+    df, _, _ = sample
     corr = correlation_matrix(df)
     # корреляция между age и height существует
     assert "age" in corr.columns or corr.empty is False
@@ -127,4 +138,227 @@ def test_compute_quality_flags_no_suspicious_id_duplicates():
     missing_df = missing_table(df)
     flags = compute_quality_flags(summary, missing_df)
 
-    assert flags["has_suspicious_id_duplicates"] is False
\ No newline at end of file
+    assert flags["has_suspicious_id_duplicates"] is False
+
+def test_correlation_matrix_matches_pandas():
+    """Быстрый путь через np.corrcoef даёт тот же результат, что и pandas."""
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "b": [2.0, 1.0, 4.0, 3.0, 6.0],
+        "c": [5, 4, 3, 2, 1],
+    })
+    corr = correlation_matrix(df)
+
+    pd.testing.assert_frame_equal(corr, df.corr())
+
+
+def test_correlation_matrix_with_missing_matches_pandas():
+    """С пропусками корреляция считается попарно, как в DataFrame.corr."""
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+        "b": [2.0, None, 4.0, 3.0, 6.0, 5.0],
+        "c": [6, 5, 4, 3, 2, 1],
+        "const": [1.0, 1.0, 1.0, None, 1.0, 1.0],
+        # постоянна на строках, общих с "b", → корреляция с ней не определена
+        "almost_const": [1.0, 2.0, 1.0, 1.0, 1.0, 1.0],
+        "large": [1e9 + 1, 1e9 + 3, 1e9 + 2, None, 1e9 + 5, 1e9 + 4],
+    })
+    corr = correlation_matrix(df)
+
+    pd.testing.assert_frame_equal(corr, df.corr())
+
+
+def test_correlation_matrix_shared_rows_far_from_column_mean():
+    """Общие строки пары далеко от среднего колонки — точность не теряется."""
+    rng = np.random.default_rng(0)
+    tail = np.full(1050, np.nan)
+    tail[-50:] = rng.normal(0, 1, 50)
+    sparse = np.full(1050, np.nan)
+    sparse[::100] = rng.normal(0, 1, 11)
+    df = pd.DataFrame({
+        "a": np.r_[rng.normal(0, 1e4, 1000), 5e6 + rng.normal(0, 1, 50)],
+        "b": tail,
+        "trend": np.arange(1050) * 1000.0 + rng.normal(0, 1, 1050),
+        "sparse": sparse,
+    })
+    corr = correlation_matrix(df)
+
+    assert not np.isnan(corr.loc["a", "b"])
+    pd.testing.assert_frame_equal(corr, df.corr(), rtol=1e-10)
+
+
+def test_top_categories_orders_by_count():
+    """top-k выбирается по убыванию частоты и при большом числе категорий."""
+    values = ["a"] * 5 + ["b"] * 3 + ["c"] * 4 + [f"rare_{i}" for i in range(100)]
+    df = pd.DataFrame({"cat": values})
+
+    table = top_categories(df, top_k=3)["cat"]
+
+    assert table["value"].tolist() == ["a", "c", "b"]
+    assert table["count"].tolist() == [5, 4, 3]
+    assert abs(table["share"].sum() - 1.0) < 1e-9
+
+
+def test_top_categories_ties_keep_first_occurrence():
+    """При равных частотах порядок — по первому появлению, а не по алфавиту."""
+    small = pd.DataFrame({"cat": ["b", "a", "d", "c"]})
+    many = pd.DataFrame({"cat": [f"v{i:03d}" for i in range(200, 0, -1)]})
+
+    assert top_categories(small, top_k=3)["cat"]["value"].tolist() == ["b", "a", "d"]
+    assert top_categories(many, top_k=3)["cat"]["value"].tolist() == ["v200", "v199", "v198"]
+
+
+def _assert_stats_match_pandas(df: pd.DataFrame, summary) -> None:
+    for col in summary.columns:
+        s = df[col.name]
+        if not col.is_numeric:
+            continue
+        if s.count() == 0:
+            assert col.min is col.max is col.mean is col.std is None
+            continue
+        assert col.min == pytest.approx(float(s.min()), rel=1e-6)
+        assert col.max == pytest.approx(float(s.max()), rel=1e-6)
+        assert col.mean == pytest.approx(float(s.mean()), rel=1e-6)
+        if s.count() > 1:
+            assert col.std == pytest.approx(float(s.std()), rel=1e-6)
+        else:
+            assert math.isnan(col.std)
+
+
+def test_numeric_stats_kernel_matches_pandas(monkeypatch):
+    """Однопроходное ядро min/max/mean/std (без numba — его Python-версия)."""
+    monkeypatch.setattr(core, "_agg4_jit", core._agg4_jit or core._agg4)
+    df = pd.DataFrame({
+        "f64": [1.5, None, -3.25, 10.0, 2.0],
+        "i64": [1, 2, 3, 4, 100],
+        "f32": np.array([0.1, 0.2, None, 0.4, 1e4], dtype="float64").astype("float32"),
+        "i16": np.array([-300, 0, 7, 32000, 5], dtype="int16"),
+        "single": [None, None, 42.0, None, None],
+    })
+    summary = summarize_dataset(df)
+
+    _assert_stats_match_pandas(df, summary)
+    single = next(c for c in summary.columns if c.name == "single")
+    assert single.min == single.max == single.mean == 42.0
+    assert math.isnan(single.std)
+
+
+def test_stats_dtype_uses_float32_only_for_exact_types():
+    assert core._stats_dtype(np.dtype("float32")) is np.float32
+    assert core._stats_dtype(np.dtype("int16")) is np.float32
+    assert core._stats_dtype(np.dtype("bool")) is np.float32
+    assert core._stats_dtype(np.dtype("int32")) is np.float64
+    assert core._stats_dtype(np.dtype("float64")) is np.float64
+
+
+def test_summarize_dataset_parallel_matches_sequential(monkeypatch):
+    """Пул потоков на широкой таблице сохраняет порядок и результат колонок."""
+    n = 30
+    df = pd.DataFrame({
+        "f": np.linspace(0.0, 1.0, n),
+        "i": np.arange(n),
+        "s": [f"v{i % 7}" for i in range(n)],
+        "b": [i % 2 == 0 for i in range(n)],
+        "nullable": pd.array([None if i % 5 == 0 else i for i in range(n)], dtype="Int64"),
+        "cat": pd.Categorical([["x", "y"][i % 2] for i in range(n)]),
+        "dt": pd.date_range("2024-01-01", periods=n),
+        "const": 1,
+        "with_nan": [None if i % 3 == 0 else float(i) for i in range(n)],
+        "i8": np.arange(n, dtype="int8"),
+    })
+    assert df.shape[1] > core.PARALLEL_MIN_COLUMNS
+
+    pools = []
+
+    class SpyExecutor(core.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(core, "ThreadPoolExecutor", SpyExecutor)
+    monkeypatch.setattr(core, "_MAX_WORKERS", 4)
+    parallel = summarize_dataset(df)
+    assert len(pools) == 1
+
+    monkeypatch.setattr(core, "PARALLEL_MIN_COLUMNS", df.shape[1])
+    sequential = summarize_dataset(df)
+    assert len(pools) == 1
+
+    assert [c.name for c in parallel.columns] == list(df.columns)
+    pd.testing.assert_frame_equal(
+        flatten_summary_for_print(parallel),
+        flatten_summary_for_print(sequential),
+    )
+    assert [c.example_values for c in parallel.columns] == [
+        c.example_values for c in sequential.columns
+    ]
+
+
+def test_summary_counts_drive_constant_and_high_cardinality_flags():
+    """n_constant / n_high_card считаются в summarize_dataset и дают флаги."""
+    n = 60
+    df = pd.DataFrame({
+        "const": ["A"] * n,
+        "const_num": [7] * n,
+        "high_card": [f"cat_{i}" for i in range(n)],
+        "num_many": range(n),  # числовая — не считается высококардинальной
+    })
+    summary = summarize_dataset(df)
+
+    assert summary.n_constant == 2
+    assert summary.n_high_card == 1
+    flags = compute_quality_flags(summary, missing_table(df))
+    assert flags["has_constant_columns"] is True
+    assert flags["has_high_cardinality_categoricals"] is True
+
+    plain = summarize_dataset(pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "a"]}))
+    assert plain.n_constant == 0 and plain.n_high_card == 0
+    flags = compute_quality_flags(plain, missing_table(pd.DataFrame({"x": [1, 2, 3]})))
+    assert flags["has_constant_columns"] is False
+    assert flags["has_high_cardinality_categoricals"] is False
+
+
+def test_dataset_summary_requires_counts():
+    with pytest.raises(TypeError):
+        DatasetSummary(n_rows=1, n_cols=0, columns=[])
+
+
+def test_classify_columns_and_correlation_subset():
+    """bool и timedelta не числовые для корреляции; object/category — категориальные."""
+    df = pd.DataFrame({
+        "i": [1, 2, 3, 5],
+        "f": [1.0, 2.5, 2.0, 7.0],
+        "nullable": pd.array([1, None, 3, 4], dtype="Int64"),
+        "flag": [True, False, True, True],
+        "delta": pd.to_timedelta([1, 2, 4, 3], unit="s"),
+        "city": ["A", "B", "A", None],
+        "plan": pd.Categorical(["x", "y", "x", "y"]),
+        "when": pd.date_range("2024-01-01", periods=4),
+    })
+    numeric_cols, cat_cols = classify_columns(df)
+
+    assert numeric_cols == ["i", "f", "nullable"]
+    assert cat_cols == ["city", "plan"]
+
+    corr = correlation_matrix(df, numeric_cols=numeric_cols)
+    pd.testing.assert_frame_equal(corr, correlation_matrix(df))
+    assert list(corr.columns) == numeric_cols
+
+
+def test_numeric_stats_block_path_matches_pandas(monkeypatch):
+    """Без numba статистики считаются блочными редукциями DataFrame."""
+    monkeypatch.setattr(core, "_agg4_jit", None)
+    df = pd.DataFrame({
+        "flag": [True, False, True, True, False],
+        "i8": np.array([-5, 0, 3, 127, 1], dtype="int8"),
+        "f32": np.array([0.5, 1.5, -2.25, 8.0, 3.0], dtype="float32"),
+        "nullable": pd.array([1, None, 3, 10, None], dtype="Int64"),
+        "all_nan": [np.nan] * 5,
+        "single": [None, None, 42.0, None, None],
+        "text": list("abcde"),
+    })
+    summary = summarize_dataset(df)
+
+    _assert_stats_match_pandas(df, summary)
+    flag = next(c for c in summary.columns if c.name == "flag")
+    assert (flag.min, flag.max) == (0.0, 1.0)